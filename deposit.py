@@ -1,24 +1,56 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import contextlib
+import dataclasses
+import email.utils
 import enum
+import hashlib
+import importlib.util
+import json
 import logging
+import mmap
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
-from pydantic import BaseModel
-from rich.console import Console
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-c = Console(width=256)
-print = c.print
+try:
+    # msgspec decodes JSON considerably faster than the standard library.
+    from msgspec.json import decode as _decode_json_bytes
+except ImportError:
+    _decode_json_bytes = json.loads  # type: ignore[assignment, unused-ignore]
+
+# HTTP/2 requires the optional 'h2' package, install with 'httpx[http2]'.
+# Fall back to HTTP/1.1 if it is not available.
+_HTTP2 = importlib.util.find_spec("h2") is not None
 
 SANDBOX_TOKEN = ""
 PROD_TOKEN = ""
 TOKEN = SANDBOX_TOKEN
 
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+# Uploads of large files can take a long time, so allow generous read and write
+# timeouts. But fail fast if we cannot connect.
+_HTTP_TIMEOUT = httpx.Timeout(connect=10.0, read=300.0, write=300.0, pool=10.0)
+_UPLOAD_CHUNK_SIZE = 1 << 20
+_DEPOSITIONS_ENDPOINT = "/deposit/depositions"
+_DEPOSITIONS_PAGE_SIZE = 100
+_WARMUP_TIMEOUT = 5.0
+
+_LOGGER = logging.getLogger("zenodo")
+
 
 def _get_logger() -> logging.Logger:
-    return logging.getLogger("zenodo")
+    return _LOGGER
 
 
 def _get_zenodo_base_url(sandbox: bool) -> str:
@@ -28,17 +60,181 @@ def _get_zenodo_base_url(sandbox: bool) -> str:
         return "https://zenodo.org/api"
 
 
+def _get_session_headers(token: str) -> dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}",
+    }
+
+
+def _log_adding_file(bucket_link: str, path: Path, name: str) -> None:
+    _get_logger().info(
+        "Adding file to deposition on bucket link '%s': '%s' with name '%s'",
+        bucket_link,
+        path,
+        name,
+    )
+
+
+def _log_file_added(path: Path, response: httpx.Response) -> None:
+    if response.is_success:
+        _get_logger().info("File successfully added: '%s'", path)
+    else:
+        _get_logger().error(
+            "Failed to add file to deposition: '%s' (%s %s)",
+            path,
+            response.status_code,
+            response.reason_phrase,
+        )
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    return _decode_json_bytes(response.content)
+
+
+def _get_last_page(response: httpx.Response) -> int | None:
+    if (last := response.links.get("last")) is None:
+        return None
+    return int(httpx.URL(last["url"]).params.get("page", 1))
+
+
+def _get_next_url(response: httpx.Response) -> str | None:
+    if (next_link := response.links.get("next")) is None:
+        return None
+    return next_link["url"]
+
+
+def _md5_digest(path: Path) -> bytes:
+    md5 = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as file:
+        try:
+            # Hash straight from the page cache without copying into Python bytes.
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, OverflowError, ValueError):
+            # Empty files and files that exceed the address space cannot be mapped.
+            while chunk := file.read(_UPLOAD_CHUNK_SIZE):
+                md5.update(chunk)
+        else:
+            with mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                md5.update(mapped)
+    return md5.digest()
+
+
+def _get_upload_headers(md5: bytes) -> dict[str, str]:
+    # Content-MD5 lets the server reject corrupted uploads.
+    return {
+        'Content-Type': 'application/octet-stream',
+        'Content-MD5': base64.b64encode(md5).decode('ascii'),
+    }
+
+
+def _validate_checksum(path: Path, response: httpx.Response, md5: bytes) -> None:
+    if not response.is_success:
+        return
+    expected = f"md5:{md5.hex()}"
+    if (actual := _decode_json(response).get("checksum")) != expected:
+        raise ValueError(
+            f"Checksum mismatch after uploading '{path}': "
+            f"expected {expected}, Zenodo returned {actual}"
+        )
+
+
+def _check_unique_file_names(paths: Iterable[Path]) -> None:
+    # Files are stored under their name only, so files with the same name
+    # would overwrite each other in the deposition.
+    seen: dict[str, Path] = {}
+    for path in paths:
+        if (other := seen.get(path.name)) is not None:
+            raise ValueError(
+                f"Cannot add both '{other}' and '{path}' to the deposition "
+                f"because they have the same name '{path.name}'"
+            )
+        seen[path.name] = path
+
+
+async def _aiter_file(path: Path) -> AsyncIterator[bytes]:
+    # Read in a worker thread to not block the event loop on disk I/O.
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, _UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    # Number of retries for failed connection attempts, handled by the transport.
+    connect_retries: int = 3
+    # Number of retries for responses with a status in `retry_statuses`.
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    # 408 (Request Timeout) is deliberately not retried. When the server's pool
+    # is saturated, resending a large request body only adds to the backlog
+    # that caused the timeout in the first place.
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    # Only retry idempotent methods to not, e.g., create a deposition twice.
+    retry_methods: frozenset[str] = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+    def backoff(self, attempt: int) -> float:
+        return self.backoff_factor * 2.0**attempt
+
+    def delay(self, attempt: int, response: httpx.Response) -> float:
+        # Rate limited responses tell us how long to wait, retrying any sooner
+        # would only be rejected again.
+        if (retry_after := _parse_retry_after(response)) is not None:
+            return retry_after
+        return self.backoff(attempt)
+
+    def should_retry(self, method: str, status_code: int, attempt: int) -> bool:
+        return (
+            attempt < self.max_retries
+            and method in self.retry_methods
+            and status_code in self.retry_statuses
+        )
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    # Retry-After is either a number of seconds or an HTTP date.
+    value: str | None = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+
+def _log_retry(method: str, endpoint: str, response: httpx.Response) -> None:
+    _get_logger().warning(
+        "%s %s failed with status %s, retrying",
+        method,
+        endpoint,
+        response.status_code,
+    )
+
+
 class Person(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     affiliation: str | None
     orcid: str | None
 
 
 class DepositionMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     upload_type: str
     title: str
     description: str
-    creators: list[Person]
+    creators: tuple[Person, ...]
     access_right: str
     license: str
     version: str
@@ -47,9 +243,16 @@ class DepositionMetadata(BaseModel):
 
 
 class Deposition(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     metadata: DepositionMetadata
 
 
+# Built once so that serialization does not need to look up the schema per call.
+# dump_json returns bytes which httpx can send without re-encoding.
+_DEPOSITION_ADAPTER: TypeAdapter[Deposition] = TypeAdapter(Deposition)
+
+
 class DepositionTransaction:
     class _State(enum.Enum):
         Pending = "pending"
@@ -57,40 +260,45 @@ class DepositionTransaction:
         Aborted = "aborted"
         Leaked = "leaked"
 
+    __slots__ = (
+        "_client",
+        "_deposition_json",
+        "_state",
+        "bucket_link",
+        "deposition_id",
+        "reserved_deposition_doi",
+    )
+
     def __init__(self, client: Client, deposition_json: dict[str, Any]) -> None:
         self._client = client
         self._deposition_json = deposition_json
         self._state = DepositionTransaction._State.Pending
+        # Extracted once because these are needed for every operation.
+        self.deposition_id: str = deposition_json["id"]
+        self.bucket_link: str = deposition_json["links"]["bucket"]
+        self.reserved_deposition_doi: str | None = (
+            deposition_json["metadata"].get("prereserve_doi") or {}
+        ).get("doi")
 
     @property
-    def deposition_id(self) -> str:
-        return self._deposition_json["id"]
-
-    @property
-    def reserved_deposition_doi(self) -> str | None:
-        if (obj := self._deposition_json['metadata'].get("prereserve_doi")) is None:
-            return None
-        return obj["doi"]
-
-    @property
-    def bucket_link(self) -> str:
-        return self._deposition_json["links"]["bucket"]
+    def deposition_json(self) -> dict[str, Any]:
+        return self._deposition_json
 
     @property
     def pending(self) -> bool:
-        return self._state == DepositionTransaction._State.Pending
+        return self._state is DepositionTransaction._State.Pending
 
     @property
     def committed(self) -> bool:
-        return self._state == DepositionTransaction._State.Committed
+        return self._state is DepositionTransaction._State.Committed
 
     @property
     def aborted(self) -> bool:
-        return self._state == DepositionTransaction._State.Aborted
+        return self._state is DepositionTransaction._State.Aborted
 
     @property
     def leaked(self) -> bool:
-        return self._state == DepositionTransaction._State.Leaked
+        return self._state is DepositionTransaction._State.Leaked
 
     def commit(self) -> None:
         if not self.pending:
@@ -131,6 +339,14 @@ class DepositionTransaction:
         self._expect_pending("add a file to")
         return self._client.add_file_to_deposition(self.bucket_link, path, name=name)
 
+    def add_files(
+        self, paths: Iterable[Path], *, concurrency: int = 8
+    ) -> dict[Path, httpx.Response | Exception]:
+        self._expect_pending("add files to")
+        return self._client.add_files_to_deposition(
+            self.bucket_link, paths, concurrency=concurrency
+        )
+
     def _expect_pending(self, operation: str) -> None:
         if not self.pending:
             raise ValueError(
@@ -147,13 +363,42 @@ class DepositionTransaction:
 
 
 class Client:
-    def __init__(self, *, sandbox: bool, token: str) -> None:
-        base_url = _get_zenodo_base_url(sandbox)
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
-        self._session = httpx.Client(base_url=base_url, headers=headers)
+    def __init__(
+        self,
+        *,
+        sandbox: bool,
+        token: str,
+        retry_policy: RetryPolicy | None = None,
+        warmup: bool = True,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self._sandbox = sandbox
+        self._token = token
+        self._retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        if transport is None:
+            # TLS sessions are not resumed across processes: ssl.SSLSession cannot
+            # be serialized and httpx provides no way to set it before the handshake.
+            transport = httpx.HTTPTransport(
+                http2=_HTTP2,
+                limits=_HTTP_LIMITS,
+                retries=self._retry_policy.connect_retries,
+            )
+        self._session = httpx.Client(
+            base_url=_get_zenodo_base_url(sandbox),
+            headers=_get_session_headers(token),
+            timeout=_HTTP_TIMEOUT,
+            transport=transport,
+        )
+
+        # Open the connection in the background so that it is ready
+        # in the pool by the time the first real request is made.
+        # This only helps with HTTP/2: with HTTP/1.1, a connection that is still
+        # being established cannot be shared and the first request would open
+        # a second one.
+        self._warmup_thread: threading.Thread | None = None
+        if warmup and _HTTP2:
+            self._warmup_thread = threading.Thread(target=self._warmup, daemon=True)
+            self._warmup_thread.start()
 
     def __enter__(self) -> Client:  # noqa: PYI034
         return self
@@ -162,31 +407,63 @@ class Client:
         self.close()
 
     def close(self) -> None:
+        # Do not wait for the warm-up to go through all connect retries
+        # when the host is unreachable.
+        if self._warmup_thread is not None:
+            self._warmup_thread.join(timeout=_WARMUP_TIMEOUT)
         self._session.close()
 
-    def get_depositions(self) -> list[dict[str, Any]]:
-        response = self._request("GET", "/deposit/depositions")
-        response.raise_for_status()
-        return response.json()
+    def _warmup(self) -> None:
+        # The warm-up is best effort and may be interrupted by close().
+        with contextlib.suppress(Exception):
+            self._session.head("/", timeout=_WARMUP_TIMEOUT)
+
+    def get_depositions(
+        self, *, page_size: int = _DEPOSITIONS_PAGE_SIZE
+    ) -> list[dict[str, Any]]:
+        # Follow the 'next' links page by page over the existing connection.
+        # Use AsyncClient.get_depositions to fetch pages concurrently.
+        response = self._request(
+            "GET", _DEPOSITIONS_ENDPOINT, params={"page": 1, "size": page_size}
+        )
+        depositions: list[dict[str, Any]] = []
+        while True:
+            response.raise_for_status()
+            depositions.extend(_decode_json(response))
+            if (next_url := _get_next_url(response)) is None:
+                return depositions
+            response = self._request("GET", next_url)
 
     def get_deposition(self, deposition_id: str) -> dict[str, Any]:
-        response = self._request("GET", f"/deposit/depositions/{deposition_id}")
+        response = self._request("GET", f"{_DEPOSITIONS_ENDPOINT}/{deposition_id}")
         response.raise_for_status()
-        return response.json()
+        return _decode_json(response)
 
     def start_new_deposition(
         self, metadata: DepositionMetadata
     ) -> DepositionTransaction:
         response = self._request(
-            "POST", "/deposit/depositions", model=Deposition(metadata=metadata)
+            "POST", _DEPOSITIONS_ENDPOINT, model=Deposition(metadata=metadata)
         )
         response.raise_for_status()
-        transaction = DepositionTransaction(self, response.json())
+        transaction = DepositionTransaction(self, _decode_json(response))
         _get_logger().info("Deposition started: %s", transaction.deposition_id)
         return transaction
 
-    def continue_deposition(self, deposition_id: str) -> DepositionTransaction:
-        deposition = self.get_deposition(deposition_id)
+    def continue_deposition(
+        self, deposition_id: str, *, deposition_json: dict[str, Any] | None = None
+    ) -> DepositionTransaction:
+        # Callers that saved the JSON of a leaked transaction can pass it
+        # to skip fetching the deposition again.
+        if deposition_json is None:
+            deposition = self.get_deposition(deposition_id)
+        else:
+            if str(deposition_json["id"]) != str(deposition_id):
+                raise ValueError(
+                    f"Cannot continue deposition {deposition_id}, the given JSON "
+                    f"is for deposition {deposition_json['id']}."
+                )
+            deposition = deposition_json
         if deposition['submitted'] or deposition['state'] in ('done', 'error'):
             raise ValueError(
                 f"Cannot continue deposition {deposition_id}, "
@@ -198,13 +475,13 @@ class Client:
 
     def commit_deposition(self, deposition_id: str) -> None:
         response = self._request(
-            "POST", f"/deposit/depositions/{deposition_id}/actions/publish"
+            "POST", f"{_DEPOSITIONS_ENDPOINT}/{deposition_id}/actions/publish"
         )
         response.raise_for_status()
         _get_logger().info("Deposition committed: %s", deposition_id)
 
     def abort_deposition(self, deposition_id: str) -> None:
-        response = self._request("DELETE", f"/deposit/depositions/{deposition_id}")
+        response = self._request("DELETE", f"{_DEPOSITIONS_ENDPOINT}/{deposition_id}")
         response.raise_for_status()
         _get_logger().warning("Deposition aborted: %s", deposition_id)
 
@@ -213,48 +490,258 @@ class Client:
     ) -> httpx.Response:
         if name is None:
             name = path.name
-        _get_logger().info(
-            "Adding file to deposition on bucket link '%s': '%s' with name '%s'",
-            bucket_link,
-            path,
-            name,
-        )
-
+        _log_adding_file(bucket_link, path, name)
+        md5 = _md5_digest(path)
+
+        # Pass the open file so that httpx streams it in chunks instead of
+        # loading the whole file into memory first.
+        # httpx derives the Content-Length from the file descriptor.
+        # There is no zero-copy (sendfile) path: Zenodo is only reachable via TLS
+        # which has to encrypt the data in user space, and httpx's HTTP/2
+        # connection does not expose its socket.
         with path.open("rb") as file:
             response = self._request(
                 "PUT",
                 f"{bucket_link}/{name}",
-                content=file.read(),
-                headers={'Content-Type': 'application/octet-stream'},
+                content=file,
+                headers=_get_upload_headers(md5),
+                # Never retry uploads, in particular not on 408, see RetryPolicy.
+                # The file has also been consumed and cannot be resent as is.
+                retry=False,
             )
 
-        if response.is_success:
-            _get_logger().info("File successfully added: '%s'", path)
-        else:
-            _get_logger().error(
-                "Failed to add file to deposition: '%s' (%s %s)",
-                path,
-                response.status_code,
-                response.reason_phrase,
-            )
-        # TODO validate checksum returned by Zenodo
+        _log_file_added(path, response)
+        _validate_checksum(path, response, md5)
         return response
 
+    def add_files_to_deposition(
+        self, bucket_link: str, paths: Iterable[Path], *, concurrency: int = 8
+    ) -> dict[Path, httpx.Response | Exception]:
+        # Run the uploads in a dedicated AsyncClient to upload concurrently.
+        # This opens a separate connection and uses asyncio.run, so it cannot be
+        # called from a running event loop (e.g., in Jupyter).
+        # Use AsyncClient.add_files_to_deposition directly there.
+        async def upload() -> dict[Path, httpx.Response | Exception]:
+            async with self._make_async_client() as client:
+                return await client.add_files_to_deposition(
+                    bucket_link, paths, concurrency=concurrency
+                )
+
+        return asyncio.run(upload())
+
+    def _make_async_client(self) -> AsyncClient:
+        # The first request of the async client opens the connection anyway,
+        # so there is nothing to gain from warming it up.
+        return AsyncClient(
+            sandbox=self._sandbox,
+            token=self._token,
+            retry_policy=self._retry_policy,
+            warmup=False,
+        )
+
     def _request(
         self,
         method: str,
         endpoint: str,
         *,
-        content: bytes | None = None,
+        content: bytes | BinaryIO | None = None,
         headers: dict[str, Any] | None = None,
-        model: BaseModel | None = None,
+        params: dict[str, Any] | None = None,
+        model: Deposition | None = None,
+        retry: bool = True,
     ) -> httpx.Response:
-        if headers is None:
-            headers = {}
+        # Pass headers through as given, httpx merges them with the session headers.
         if model is not None:
-            content = model.model_dump_json(exclude_none=True)
-            headers["Content-Type"] = "application/json"
-        return self._session.request(method, endpoint, content=content, headers=headers)
+            # The session sends 'Content-Type: application/json' by default.
+            content = _DEPOSITION_ADAPTER.dump_json(model, exclude_none=True)
+
+        attempt = 0
+        while True:
+            response = self._session.request(
+                method, endpoint, content=content, headers=headers, params=params
+            )
+            if not retry or not self._retry_policy.should_retry(
+                method, response.status_code, attempt
+            ):
+                return response
+            _log_retry(method, endpoint, response)
+            response.close()
+            time.sleep(self._retry_policy.delay(attempt, response))
+            attempt += 1
+
+
+class AsyncClient:
+    def __init__(
+        self,
+        *,
+        sandbox: bool,
+        token: str,
+        retry_policy: RetryPolicy | None = None,
+        warmup: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._warmup = warmup
+        self._warmup_task: asyncio.Task[None] | None = None
+        self._retry_policy = RetryPolicy() if retry_policy is None else retry_policy
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=_HTTP2,
+                limits=_HTTP_LIMITS,
+                retries=self._retry_policy.connect_retries,
+            )
+        self._session = httpx.AsyncClient(
+            base_url=_get_zenodo_base_url(sandbox),
+            headers=_get_session_headers(token),
+            timeout=_HTTP_TIMEOUT,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> AsyncClient:  # noqa: PYI034
+        # Needs a running event loop, so this cannot be done in __init__.
+        # Only useful with HTTP/2, see Client.__init__.
+        if self._warmup and _HTTP2:
+            self._warmup_task = asyncio.create_task(self._warmup_connection())
+        return self
+
+    async def __aexit__(
+        self, exc_type: object, exc_val: object, exc_tb: object
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._warmup_task
+        await self._session.aclose()
+
+    async def _warmup_connection(self) -> None:
+        with contextlib.suppress(httpx.HTTPError):
+            await self._session.head("/", timeout=_WARMUP_TIMEOUT)
+
+    async def get_depositions(
+        self, *, page_size: int = _DEPOSITIONS_PAGE_SIZE, concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        response = await self._get_depositions_page(1, page_size=page_size)
+        depositions: list[dict[str, Any]] = _decode_json(response)
+        # If the first page tells us how many pages there are,
+        # the rest can be requested concurrently.
+        if (last_page := _get_last_page(response)) is not None:
+            depositions.extend(
+                await self._get_depositions_pages(
+                    range(2, last_page + 1),
+                    page_size=page_size,
+                    concurrency=concurrency,
+                )
+            )
+            return depositions
+
+        # Otherwise, follow the 'next' links one by one.
+        while (next_url := _get_next_url(response)) is not None:
+            response = await self._request("GET", next_url)
+            response.raise_for_status()
+            depositions.extend(_decode_json(response))
+        return depositions
+
+    async def _get_depositions_pages(
+        self, pages: Iterable[int], *, page_size: int, concurrency: int
+    ) -> list[dict[str, Any]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_page(page: int) -> httpx.Response:
+            async with semaphore:
+                return await self._get_depositions_page(page, page_size=page_size)
+
+        responses = await asyncio.gather(*(get_page(page) for page in pages))
+        return [
+            deposition
+            for response in responses
+            for deposition in _decode_json(response)
+        ]
+
+    async def _get_depositions_page(
+        self, page: int, *, page_size: int
+    ) -> httpx.Response:
+        response = await self._request(
+            "GET", _DEPOSITIONS_ENDPOINT, params={"page": page, "size": page_size}
+        )
+        response.raise_for_status()
+        return response
+
+    async def add_file_to_deposition(
+        self, bucket_link: str, path: Path, *, name: str | None
+    ) -> httpx.Response:
+        if name is None:
+            name = path.name
+        _log_adding_file(bucket_link, path, name)
+        md5 = await asyncio.to_thread(_md5_digest, path)
+
+        # The body is an async iterator without a length,
+        # so set Content-Length explicitly to avoid chunked transfer encoding.
+        response = await self._request(
+            "PUT",
+            f"{bucket_link}/{name}",
+            content=_aiter_file(path),
+            headers={
+                **_get_upload_headers(md5),
+                'Content-Length': str(path.stat().st_size),
+            },
+            # Never retry uploads, see Client.add_file_to_deposition.
+            retry=False,
+        )
+
+        _log_file_added(path, response)
+        _validate_checksum(path, response, md5)
+        return response
+
+    async def add_files_to_deposition(
+        self, bucket_link: str, paths: Iterable[Path], *, concurrency: int = 8
+    ) -> dict[Path, httpx.Response | Exception]:
+        # Limit the number of uploads in flight at the same time.
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Return errors instead of raising them so that one failed upload
+        # does not hide the results of the others.
+        async def upload(path: Path) -> httpx.Response | Exception:
+            async with semaphore:
+                try:
+                    return await self.add_file_to_deposition(
+                        bucket_link, path, name=None
+                    )
+                except Exception as error:
+                    _get_logger().error(
+                        "Failed to add file to deposition: '%s' (%s)", path, error
+                    )
+                    return error
+
+        paths = list(paths)
+        _check_unique_file_names(paths)
+        results = await asyncio.gather(*(upload(path) for path in paths))
+        return dict(zip(paths, results, strict=True))
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        content: bytes | AsyncIterator[bytes] | None = None,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        retry: bool = True,
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._session.request(
+                method, endpoint, content=content, headers=headers, params=params
+            )
+            if not retry or not self._retry_policy.should_retry(
+                method, response.status_code, attempt
+            ):
+                return response
+            _log_retry(method, endpoint, response)
+            await response.aclose()
+            await asyncio.sleep(self._retry_policy.delay(attempt, response))
+            attempt += 1
 
 
 def main() -> None:
@@ -268,31 +755,35 @@ def main() -> None:
         upload_type='software',
         title='Test Zenodo upload 3',
         description="Testing uploading to Zenodo",
-        creators=[
+        creators=(
             Person(
                 name='Jan-Lukas Wynen',
                 affiliation='European Spallation Source ERIC',
                 orcid='0000-0002-3761-3201',
-            )
-        ],
+            ),
+        ),
         access_right='open',
         license='BSD-3-Clause',
         version='0.3',
         prereserve_doi=True,
     )
 
+    # Use a single client for both phases to reuse the connection to Zenodo.
     with Client(sandbox=True, token=TOKEN) as client:
         with client.start_new_deposition(depo) as transaction:
             doi: str = transaction.reserved_deposition_doi
             depo_id = transaction.deposition_id
-            # leak because the following code will be in a separate process on GH
+            # Passed to continue_deposition below to avoid fetching it again.
+            depo_json = transaction.deposition_json
+            # leak to keep the deposition open until the file is added below
             transaction.leak()
 
-    # write CITATION.cff and make GH & PyPI releases here
-    _get_logger().info("DOI: %s", doi)
+        # write CITATION.cff and make GH & PyPI releases here
+        _get_logger().info("DOI: %s", doi)
 
-    with Client(sandbox=True, token=TOKEN) as client:
-        with client.continue_deposition(depo_id) as transaction:
+        with client.continue_deposition(
+            depo_id, deposition_json=depo_json
+        ) as transaction:
             r = transaction.add_file(Path('CITATION.cff'))
             r.raise_for_status()
             transaction.leak()
@@ -0,0 +1,302 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 Jl-wynen contributors (https://github.com/jl-wynen)
+
+"""Tests of the Zenodo client in deposit.py using mocked transports."""
+
+import asyncio
+import base64
+import hashlib
+import threading
+import time
+
+import httpx
+import pytest
+
+import deposit
+
+NO_BACKOFF = deposit.RetryPolicy(backoff_factor=0.0)
+
+
+def make_client(handler):
+    return deposit.Client(
+        sandbox=True,
+        token="",
+        retry_policy=NO_BACKOFF,
+        warmup=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def make_async_client(handler):
+    return deposit.AsyncClient(
+        sandbox=True,
+        token="",
+        retry_policy=NO_BACKOFF,
+        warmup=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def responding_with(*status_codes):
+    requests = []
+    codes = iter(status_codes)
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(next(codes), json=[])
+
+    return handler, requests
+
+
+def test_request_retries_retryable_status():
+    handler, requests = responding_with(503, 502, 200)
+    with make_client(handler) as client:
+        response = client._request("GET", "/deposit/depositions")
+    assert response.status_code == 200
+    assert len(requests) == 3
+
+
+def test_request_gives_up_after_max_retries():
+    handler, requests = responding_with(*[503] * 10)
+    with make_client(handler) as client:
+        response = client._request("GET", "/deposit/depositions")
+    assert response.status_code == 503
+    assert len(requests) == NO_BACKOFF.max_retries + 1
+
+
+def test_request_does_not_retry_408():
+    handler, requests = responding_with(408, 200)
+    with make_client(handler) as client:
+        response = client._request("GET", "/deposit/depositions")
+    assert response.status_code == 408
+    assert len(requests) == 1
+
+
+def test_request_does_not_retry_non_idempotent_method():
+    handler, requests = responding_with(503, 200)
+    with make_client(handler) as client:
+        response = client._request("POST", "/deposit/depositions")
+    assert response.status_code == 503
+    assert len(requests) == 1
+
+
+def test_async_request_retries_retryable_status():
+    handler, requests = responding_with(503, 503, 200)
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await client.get_depositions()
+
+    assert asyncio.run(run()) == []
+    assert len(requests) == 3
+
+
+def test_add_file_to_deposition_does_not_retry(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("content")
+    handler, requests = responding_with(503, 200)
+    with make_client(handler) as client:
+        response = client.add_file_to_deposition("https://bucket", path, name=None)
+    assert response.status_code == 503
+    assert len(requests) == 1
+
+
+def paginated(n_pages, *, with_last):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        page = int(request.url.params["page"])
+        links = []
+        if page < n_pages:
+            links.append(
+                f'<{request.url.copy_set_param("page", page + 1)}>; rel="next"'
+            )
+        if with_last:
+            links.append(f'<{request.url.copy_set_param("page", n_pages)}>; rel="last"')
+        return httpx.Response(
+            200, json=[{"id": page}], headers={"Link": ", ".join(links)}
+        )
+
+    return handler, requests
+
+
+@pytest.mark.parametrize("with_last", [True, False])
+def test_get_depositions_fetches_all_pages(with_last):
+    handler, requests = paginated(3, with_last=with_last)
+    with make_client(handler) as client:
+        depositions = client.get_depositions()
+    assert depositions == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert len(requests) == 3
+
+
+@pytest.mark.parametrize("with_last", [True, False])
+def test_async_get_depositions_fetches_all_pages(with_last):
+    handler, requests = paginated(3, with_last=with_last)
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await client.get_depositions()
+
+    assert asyncio.run(run()) == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert len(requests) == 3
+
+
+def test_add_files_to_deposition_reports_results_per_file(tmp_path):
+    good = tmp_path / "good.txt"
+    good.write_text("good")
+    bad = tmp_path / "bad.txt"
+    bad.write_text("bad")
+
+    def handler(request):
+        body = request.read()
+        if request.url.path.endswith("bad.txt"):
+            checksum = "md5:0"  # wrong checksum
+        else:
+            checksum = f"md5:{hashlib.md5(body, usedforsecurity=False).hexdigest()}"
+        return httpx.Response(201, json={"checksum": checksum})
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await client.add_files_to_deposition("https://bucket", [bad, good])
+
+    results = asyncio.run(run())
+    assert isinstance(results[bad], ValueError)
+    assert results[good].status_code == 201
+
+
+def test_close_does_not_wait_for_slow_warmup(monkeypatch):
+    monkeypatch.setattr(deposit, "_HTTP2", True)
+    monkeypatch.setattr(deposit, "_WARMUP_TIMEOUT", 0.1)
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(timeout=5)
+        return httpx.Response(200)
+
+    client = deposit.Client(
+        sandbox=True, token="", transport=httpx.MockTransport(handler)
+    )
+    start = time.monotonic()
+    client.close()
+    assert time.monotonic() - start < 1
+    release.set()
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected_delays"),
+    [({}, [0.5, 1.0]), ({"Retry-After": "7"}, [7.0, 7.0])],
+)
+def test_request_waits_for_retry_after(monkeypatch, headers, expected_delays):
+    delays = []
+    monkeypatch.setattr(deposit.time, "sleep", delays.append)
+    codes = iter([429, 429, 200])
+
+    def handler(request):
+        return httpx.Response(next(codes), headers=headers)
+
+    client = deposit.Client(
+        sandbox=True,
+        token="",
+        retry_policy=deposit.RetryPolicy(),
+        warmup=False,
+        transport=httpx.MockTransport(handler),
+    )
+    with client:
+        response = client._request("GET", "/deposit/depositions")
+    assert response.status_code == 200
+    assert delays == expected_delays
+
+
+def test_no_warmup_without_http2(monkeypatch):
+    monkeypatch.setattr(deposit, "_HTTP2", False)
+    handler, requests = responding_with(200)
+    client = deposit.Client(
+        sandbox=True, token="", transport=httpx.MockTransport(handler)
+    )
+    client.close()
+    assert requests == []
+
+
+def deposition_json(deposition_id, *, submitted=False, state="unsubmitted"):
+    return {
+        "id": deposition_id,
+        "submitted": submitted,
+        "state": state,
+        "links": {"bucket": "https://bucket"},
+        "metadata": {},
+    }
+
+
+def test_continue_deposition_with_json_does_not_fetch():
+    handler, requests = responding_with()
+    with make_client(handler) as client:
+        transaction = client.continue_deposition(
+            "12", deposition_json=deposition_json(12)
+        )
+        transaction.leak()
+    assert requests == []
+    assert transaction.deposition_id == 12
+
+
+@pytest.mark.parametrize(
+    "json",
+    [
+        deposition_json(12, submitted=True),
+        deposition_json(12, state="done"),
+        deposition_json(13),
+    ],
+)
+def test_continue_deposition_rejects_json(json):
+    handler, requests = responding_with()
+    with make_client(handler) as client, pytest.raises(ValueError, match="12"):
+        client.continue_deposition("12", deposition_json=json)
+    assert requests == []
+
+
+def checksum_handler(requests, *, checksum=None):
+    def handler(request):
+        body = request.read()
+        requests.append(request)
+        md5 = hashlib.md5(body, usedforsecurity=False).hexdigest()
+        return httpx.Response(201, json={"checksum": checksum or f"md5:{md5}"})
+
+    return handler
+
+
+@pytest.mark.parametrize("content", [b"some content", b""])
+def test_add_file_to_deposition_sends_content_md5(tmp_path, content):
+    path = tmp_path / "file.txt"
+    path.write_bytes(content)
+    requests = []
+    with make_client(checksum_handler(requests)) as client:
+        response = client.add_file_to_deposition("https://bucket", path, name=None)
+    assert response.status_code == 201
+    expected = base64.b64encode(hashlib.md5(content, usedforsecurity=False).digest())
+    assert requests[0].headers["Content-MD5"] == expected.decode()
+    assert requests[0].content == content
+
+
+def test_add_file_to_deposition_raises_on_checksum_mismatch(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"some content")
+    requests = []
+    handler = checksum_handler(requests, checksum="md5:0")
+    with make_client(handler) as client, pytest.raises(ValueError, match="Checksum"):
+        client.add_file_to_deposition("https://bucket", path, name=None)
+
+
+def test_add_files_to_deposition_rejects_duplicate_names(tmp_path):
+    paths = [tmp_path / "a" / "x.txt", tmp_path / "b" / "x.txt"]
+    for path in paths:
+        path.parent.mkdir()
+        path.write_text("content")
+    handler, requests = responding_with()
+
+    async def run():
+        async with make_async_client(handler) as client:
+            return await client.add_files_to_deposition("https://bucket", paths)
+
+    with pytest.raises(ValueError, match=r"same name 'x\.txt'"):
+        asyncio.run(run())
+    assert requests == []